@@ -1,12 +1,11 @@
 import streamlit as st
-from sqlalchemy import text
 import sys
 from pathlib import Path
-import datetime as dt
 
-sys.path.append(str(Path(__file__).parent.parent))
+root = str(Path(__file__).parent.parent.parent)
+if root not in sys.path:
+    sys.path.append(root)
 import shared.utils as u
-import time
 
 
 # TODO: This is a bad way of authenticating. A week or two after I added it, streamlit added st.login(), but at time of writing it's still in the expiremental phase. Replace all this dumb sqlite stuff with st.login() when it's stable.
@@ -1,13 +1,12 @@
 import streamlit as st
-import datetime as dt
-from sqlalchemy import text
 import sys
 from pathlib import Path
 import time
 
-sys.path.append(str(Path(__file__).parent.parent))
+root = str(Path(__file__).parent.parent)
+if root not in sys.path:
+    sys.path.append(root)
 import shared.utils as u
-import pandas as pd
 
 
 # TODO: This is a bad way of authenticating. A week or two after I added it, streamlit added st.login(), but at time of writing it's still in the expiremental phase. Replace all this dumb sqlite stuff with st.login() when it's stable.
@@ -17,6 +16,7 @@ import pandas as pd
 if not u.check_password("kitchen"):
     st.stop()
 
+import pandas as pd
 
 st.title("Ingredient Cost Entry")
 
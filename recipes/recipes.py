@@ -4,22 +4,32 @@ from pathlib import Path
 import uuid
 
 import streamlit as st
-import boto3
-import pandas as pd
 
-sys.path.append(str(Path(__file__).parent.parent))
+root = str(Path(__file__).parent.parent)
+if root not in sys.path:
+    sys.path.append(root)
 from shared import utils as u
 
 if not u.check_password():
     st.stop()
 
+import pandas as pd
+
+
+@st.cache_resource
+def get_s3():
+    import boto3
+
+    return boto3.client(
+        "s3",
+        aws_access_key_id=st.secrets.recipes.access_key_id,
+        aws_secret_access_key=st.secrets.recipes.secret_access_key,
+        region_name=st.secrets.shared_aws.region,
+    )
+
+
 db = u.get_db("recipes")
-s3 = boto3.client(
-    "s3",
-    aws_access_key_id=st.secrets.recipes.access_key_id,
-    aws_secret_access_key=st.secrets.recipes.secret_access_key,
-    region_name=st.secrets.shared_aws.region,
-)
+s3 = get_s3()
 prices = u.get_new_entries(db.get_all_prices(), ["ingredient_id"])
 ingredients = u.get_new_entries(db.get_all_ingredients(), ["id"])
 
@@ -0,0 +1,75 @@
+"""Startup benchmark for the Streamlit entry points.
+
+Run from the repo root with `python -m shared.bench_startup`. Each entry point is rendered once with AppTest in a fresh process, the same as the first visitor after a restart, who gets the login form. It fails if that first render loads boto3, pandas or sqlalchemy, raises, or goes over budget.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+ENTRY_POINTS = (
+    "prices/prices.py",
+    "prices/pages/01_ingredients.py",
+    "recipes/recipes.py",
+)
+HEAVY = ("boto3", "botocore", "pandas", "sqlalchemy")
+# Measured first render of the login screen: 1200-1400 ms with everything imported up front, 530-630 ms with only sqlalchemy left, 230-280 ms now. About 215-255 ms of that is AppTest rendering an empty script, so that's the floor. The heavy module check is the real guard; this catches anything else that gets slow.
+BUDGET_MS = 450
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=60).run()
+rendered = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "render_ms": (rendered - imported) * 1000,
+    "modules": sorted(sys.modules),
+    "errors": [e.value for e in at.exception],
+}))
+"""
+
+
+def probe(entry: str) -> dict:
+    """First render of an entry point in a fresh process. Run from a scratch directory so the lockout DB it creates doesn't land in the repo."""
+    with tempfile.TemporaryDirectory() as scratch:
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE, str(ROOT / entry)],
+            cwd=scratch,
+            capture_output=True,
+            text=True,
+        )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"exit code {result.returncode}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    failed = False
+    for entry in ENTRY_POINTS:
+        try:
+            result = probe(entry)
+        except Exception as e:
+            print(f"FAIL  {entry}: probe crashed\n{e}")
+            failed = True
+            continue
+        heavy = sorted({m.split(".")[0] for m in result["modules"]} & set(HEAVY))
+        slow = result["render_ms"] > BUDGET_MS
+        bad = bool(heavy or slow or result["errors"])
+        print(
+            f"{'FAIL' if bad else 'ok':4}  {entry}: streamlit import {result['import_ms']:.0f} ms, login screen {result['render_ms']:.0f} ms (budget {BUDGET_MS} ms), heavy modules loaded: {heavy or 'none'}"
+        )
+        for error in result["errors"]:
+            print(f"      {error}")
+        failed = failed or bad
+    print("For a per-module breakdown: python -X importtime -c 'import shared.utils'")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
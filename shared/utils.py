@@ -1,23 +1,30 @@
+from __future__ import annotations
+
 import time
 import json
+import sqlite3
+from contextlib import closing
 from decimal import Decimal
-from typing import Dict, Any
+from typing import Dict, Any, TYPE_CHECKING
 from pathlib import Path
 import uuid
 import datetime as dt
 
-from sqlalchemy import text, create_engine
 import streamlit as st
-import boto3
-import pandas as pd
+
+# boto3 and pandas are slow to import and neither is needed to draw the login form, so they're imported where they're used. Python caches the imports, so it only costs anything the first time.
+if TYPE_CHECKING:
+    import pandas as pd
 
 
-def get_local_connection():
+def get_local_connection() -> sqlite3.Connection:
+    # Plain sqlite3 rather than sqlalchemy: it's one tiny table, and this runs before login. Connecting and the IF NOT EXISTS are cheap enough to do every time, which also means deleting the db file while the app is up doesn't break anything.
     db_path = Path(".streamlit/db.db").absolute()
     db_path.parent.mkdir(exist_ok=True)
-    engine = create_engine(f"sqlite:///{db_path}")
-    with engine.connect() as conn:
-        lockout_table_sql = """
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        """
         CREATE TABLE IF NOT EXISTS lockouts (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             ip TEXT NOT NULL,
@@ -26,13 +33,8 @@ def get_local_connection():
             UNIQUE(ip)
         );
         """
-        try:
-            conn.execute(text(lockout_table_sql))
-        except Exception as e:
-            if "already exists" not in str(e):
-                raise e
-        conn.commit()
-    return st.connection("db", type="sql", url=f"sqlite:///{db_path}")
+    )
+    return conn
 
 
 class DynamoDBConnector:
@@ -43,7 +45,10 @@ class DynamoDBConnector:
 
     def __init__(self, app: str):
         """Initialize DynamoDB client using streamlit secrets"""
-        self.dynamodb = boto3.resource(
+        import boto3
+
+        # Own session rather than boto3's shared default one, since sessions and resources aren't thread-safe and every browser session runs on its own thread.
+        self.dynamodb = boto3.session.Session().resource(
             "dynamodb",
             aws_access_key_id=st.secrets[app].access_key_id,
             aws_secret_access_key=st.secrets[app].secret_access_key,
@@ -118,6 +123,8 @@ class DynamoDBConnector:
     # Helper method
     def _get_all_items_as_df(self, table) -> pd.DataFrame:
         """Generic method to get all items from a table as DataFrame"""
+        import pandas as pd
+
         response = table.scan()
         items = response.get("Items", [])
         # Handle pagination
@@ -140,8 +147,11 @@ class DynamoDBConnector:
 
 
 def get_db(app: str) -> DynamoDBConnector:
-    """Get unified database connector"""
-    return DynamoDBConnector(app)
+    """Get unified database connector, built once per browser session"""
+    key = f"db_{app}"
+    if key not in st.session_state:
+        st.session_state[key] = DynamoDBConnector(app)
+    return st.session_state[key]
 
 
 def check_password(password_name="admin"):
@@ -149,22 +159,22 @@ def check_password(password_name="admin"):
     if st.session_state.get("authenticated"):
         return True
     ip = st.query_params.get("client_ip", ["unknown"])[0]
-    with get_local_connection().session as session:
-        lockout = session.execute(
-            text("SELECT attempts, last_attempt FROM lockouts WHERE ip = :ip"),
+    with closing(get_local_connection()) as conn:
+        lockout = conn.execute(
+            "SELECT attempts, last_attempt FROM lockouts WHERE ip = :ip",
             {"ip": ip},
         ).fetchone()
         current_time = int(dt.datetime.now().timestamp())
-        if lockout and lockout.attempts >= 10:
-            if current_time - lockout.last_attempt < 300:
+        if lockout and lockout["attempts"] >= 10:
+            if current_time - lockout["last_attempt"] < 300:
                 st.error("Too many attempts. Please wait 5 minutes.")
                 time.sleep(2)
                 return False
             else:
-                session.execute(
-                    text("UPDATE lockouts SET attempts = 0 WHERE ip = :ip"), {"ip": ip}
+                conn.execute(
+                    "UPDATE lockouts SET attempts = 0 WHERE ip = :ip", {"ip": ip}
                 )
-                session.commit()
+                conn.commit()
 
     with st.form("login", clear_on_submit=True):
         password = st.text_input(
@@ -180,20 +190,18 @@ def check_password(password_name="admin"):
                 st.rerun()
                 return True
             else:
-                with get_local_connection().session as session:
-                    session.execute(
-                        text(
-                            """
-                            INSERT INTO lockouts (ip, attempts, last_attempt) 
-                            VALUES (:ip, 1, :time)
-                            ON CONFLICT(ip) DO UPDATE SET 
-                            attempts = attempts + 1,
-                            last_attempt = :time
+                with closing(get_local_connection()) as conn:
+                    conn.execute(
                         """
-                        ),
+                        INSERT INTO lockouts (ip, attempts, last_attempt) 
+                        VALUES (:ip, 1, :time)
+                        ON CONFLICT(ip) DO UPDATE SET 
+                        attempts = attempts + 1,
+                        last_attempt = :time
+                        """,
                         {"ip": ip, "time": current_time},
                     )
-                    session.commit()
+                    conn.commit()
                 st.error("Incorrect password")
                 time.sleep(1)
                 return False
@@ -203,6 +211,8 @@ def check_password(password_name="admin"):
 def display_df(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty or "timestamp" not in df.columns:
         return df
+    import pandas as pd
+
     display = df.copy()
     display["date"] = pd.to_datetime(display["timestamp"], unit="s", utc=True)
     display["date"] = display["date"].dt.strftime("%Y-%m-%d (UTC)")